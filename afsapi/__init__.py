@@ -3,11 +3,13 @@ from afsapi.exceptions import (
     FSApiException,
     InvalidPinException,
     InvalidSessionException,
+    NodeBlockedException,
     NotImplementedException,
     OutOfRangeException,
     ConnectionError,
+    TimeoutException,
 )
-from afsapi.models import Preset, Equaliser, PlayerMode, PlayControl, PlayState
+from afsapi.models import Preset, Equaliser, PlayerMode, PlayControl, PlayState, DeviceState
 
 from importlib.metadata import version, PackageNotFoundError
 
@@ -25,6 +27,6 @@ except PackageNotFoundError:  # pragma: no cover
 __version__ = VERSION
 
 __all__ = ['AFSAPI', 'PlayState', 'PlayControl', 'PlayerMode', 'Equaliser',
-           'Preset', 'FSApiException', 'NotImplementedException',
-           'ConnectionError', 'OutOfRangeException', 'InvalidPinException',
-           'InvalidSessionException']
+           'Preset', 'DeviceState', 'FSApiException', 'NotImplementedException',
+           'ConnectionError', 'TimeoutException', 'OutOfRangeException', 'InvalidPinException',
+           'InvalidSessionException', 'NodeBlockedException']
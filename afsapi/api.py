@@ -5,6 +5,7 @@ For example internet radios from: Medion, Hama, Auna, ...
 """
 
 import asyncio
+import functools
 from asyncio.exceptions import TimeoutError
 import typing as t
 import logging
@@ -12,18 +13,30 @@ from afsapi.exceptions import (
     FSApiException,
     InvalidPinException,
     InvalidSessionException,
+    NodeBlockedException,
     NotImplementedException,
     OutOfRangeException,
     ConnectionError,
+    TimeoutException,
+)
+from afsapi.models import (
+    Preset,
+    Equaliser,
+    PlayerMode,
+    PlayControl,
+    PlayState,
+    DeviceState,
 )
-from afsapi.models import Preset, Equaliser, PlayerMode, PlayControl, PlayState
 from afsapi.throttler import Throttler
-from afsapi.utils import unpack_xml, maybe
+from afsapi.utils import unpack_xml, unpack_value, unpack_number
 from enum import Enum
+from types import TracebackType
 import aiohttp
 import xml.etree.ElementTree as ET
+from yarl import URL
 
 DataItem = t.Union[str, int]
+CallParams = t.Union[t.Dict[str, DataItem], t.List[t.Tuple[str, DataItem]]]
 
 
 DEFAULT_TIMEOUT_IN_SECONDS = 15
@@ -32,6 +45,16 @@ TIME_AFTER_READ_CALLS_IN_SECONDS = 0
 TIME_AFTER_SET_CALLS_IN_SECONDS = 0.3
 TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS = 1.0
 
+# well above the time the device holds an idle GET_NOTIFIES before answering FS_TIMEOUT itself
+NOTIFY_TIMEOUT_IN_SECONDS = 60
+_NOTIFY_CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=NOTIFY_TIMEOUT_IN_SECONDS)
+
+CONNECTION_POOL_LIMIT = 20
+KEEPALIVE_TIMEOUT_IN_SECONDS = 60
+URL_CACHE_SIZE = 128
+# operations that only read from the device and can be sent again without side effects
+_READ_OPERATIONS = frozenset(("GET", "GET_MULTIPLE", "LIST_GET_NEXT"))
+
 FSApiValueType = Enum("FSApiValueType", "TEXT BOOL INT LONG SIGNED_LONG")
 
 VALUE_TYPE_TO_XML_PATH = {
@@ -45,58 +68,115 @@ READ_ONLY = False
 READ_WRITE = True
 
 # implemented API calls
+# sys
+API_POWER = "netRemote.sys.power"
+API_MODE = "netRemote.sys.mode"
+API_WIRED_MAC = "netRemote.sys.net.wired.macAddress"
+API_WIRED_ACTIVE = "netRemote.sys.net.wired.interfaceEnable"
+API_WLAN_MAC = "netRemote.sys.net.wlan.macAddress"
+API_WLAN_ACTIVE = "netRemote.sys.net.wlan.interfaceEnable"
+API_RSSI = "netRemote.sys.net.wlan.rssi"
+# sys.info
+API_FRIENDLY_NAME = "netRemote.sys.info.friendlyName"
+API_RADIO_ID = "netRemote.sys.info.radioId"
+API_VERSION = "netRemote.sys.info.version"
+# sys.caps
+API_VALID_MODES = "netRemote.sys.caps.validModes"
+API_EQUALISERS = "netRemote.sys.caps.eqPresets"
+API_SLEEP = "netRemote.sys.sleep"
+# sys.audio
+API_EQPRESET = "netRemote.sys.audio.eqpreset"
+API_EQLOUDNESS = "netRemote.sys.audio.eqloudness"
+API_BASS = "netRemote.sys.audio.eqcustom.param0"
+API_TREBLE = "netRemote.sys.audio.eqcustom.param1"
+# volume
+API_VOLUME_STEPS = "netRemote.sys.caps.volumeSteps"
+API_VOLUME = "netRemote.sys.audio.volume"
+API_MUTE = "netRemote.sys.audio.mute"
+# play
+API_STATUS = "netRemote.play.status"
+API_NAME = "netRemote.play.info.name"
+API_CONTROL = "netRemote.play.control"
+API_SHUFFLE = "netRemote.play.shuffle"
+API_REPEAT = "netRemote.play.repeat"
+API_POSITION = "netRemote.play.position"
+API_RATE = "netRemote.play.rate"
+# info
+API_TEXT = "netRemote.play.info.text"
+API_ARTIST = "netRemote.play.info.artist"
+API_ALBUM = "netRemote.play.info.album"
+API_GRAPHIC_URI = "netRemote.play.info.graphicUri"
+API_DURATION = "netRemote.play.info.duration"
+# nav
+API_NAV_STATE = "netRemote.nav.state"
+API_NUMITEMS = "netRemote.nav.numitems"
+API_NAV_LIST = "netRemote.nav.list"
+API_NAVIGATE = "netRemote.nav.action.navigate"
+API_SELECT_ITEM = "netRemote.nav.action.selectItem"
+API_PRESETS = "netRemote.nav.presets"
+API_SELECT_PRESET = "netRemote.nav.action.selectPreset"
+
+# lookup of the calls above by name
 API = {
     # sys
-    "power": "netRemote.sys.power",
-    "mode": "netRemote.sys.mode",
-    "wired_mac": "netRemote.sys.net.wired.macAddress",
-    "wired_active": "netRemote.sys.net.wired.interfaceEnable",
-    "wlan_mac": "netRemote.sys.net.wlan.macAddress",
-    "wlan_active": "netRemote.sys.net.wlan.interfaceEnable",
-    "rssi": "netRemote.sys.net.wlan.rssi",
+    "power": API_POWER,
+    "mode": API_MODE,
+    "wired_mac": API_WIRED_MAC,
+    "wired_active": API_WIRED_ACTIVE,
+    "wlan_mac": API_WLAN_MAC,
+    "wlan_active": API_WLAN_ACTIVE,
+    "rssi": API_RSSI,
     # sys.info
-    "friendly_name": "netRemote.sys.info.friendlyName",
-    "radio_id": "netRemote.sys.info.radioId",
-    "version": "netRemote.sys.info.version",
+    "friendly_name": API_FRIENDLY_NAME,
+    "radio_id": API_RADIO_ID,
+    "version": API_VERSION,
     # sys.caps
-    "valid_modes": "netRemote.sys.caps.validModes",
-    "equalisers": "netRemote.sys.caps.eqPresets",
-    "sleep": "netRemote.sys.sleep",
+    "valid_modes": API_VALID_MODES,
+    "equalisers": API_EQUALISERS,
+    "sleep": API_SLEEP,
     # sys.audio
-    "eqpreset": "netRemote.sys.audio.eqpreset",
-    "eqloudness": "netRemote.sys.audio.eqloudness",
-    "bass": "netRemote.sys.audio.eqcustom.param0",
-    "treble": "netRemote.sys.audio.eqcustom.param1",
+    "eqpreset": API_EQPRESET,
+    "eqloudness": API_EQLOUDNESS,
+    "bass": API_BASS,
+    "treble": API_TREBLE,
     # volume
-    "volume_steps": "netRemote.sys.caps.volumeSteps",
-    "volume": "netRemote.sys.audio.volume",
-    "mute": "netRemote.sys.audio.mute",
+    "volume_steps": API_VOLUME_STEPS,
+    "volume": API_VOLUME,
+    "mute": API_MUTE,
     # play
-    "status": "netRemote.play.status",
-    "name": "netRemote.play.info.name",
-    "control": "netRemote.play.control",
-    "shuffle": "netRemote.play.shuffle",
-    "repeat": "netRemote.play.repeat",
-    "position": "netRemote.play.position",
-    "rate": "netRemote.play.rate",
+    "status": API_STATUS,
+    "name": API_NAME,
+    "control": API_CONTROL,
+    "shuffle": API_SHUFFLE,
+    "repeat": API_REPEAT,
+    "position": API_POSITION,
+    "rate": API_RATE,
     # info
-    "text": "netRemote.play.info.text",
-    "artist": "netRemote.play.info.artist",
-    "album": "netRemote.play.info.album",
-    "graphic_uri": "netRemote.play.info.graphicUri",
-    "duration": "netRemote.play.info.duration",
+    "text": API_TEXT,
+    "artist": API_ARTIST,
+    "album": API_ALBUM,
+    "graphic_uri": API_GRAPHIC_URI,
+    "duration": API_DURATION,
     # nav
-    "nav_state": "netRemote.nav.state",
-    "numitems": "netRemote.nav.numitems",
-    "nav_list": "netRemote.nav.list",
-    "navigate": "netRemote.nav.action.navigate",
-    "selectItem": "netRemote.nav.action.selectItem",
-    "presets": "netRemote.nav.presets",
-    "selectPreset": "netRemote.nav.action.selectPreset",
+    "nav_state": API_NAV_STATE,
+    "numitems": API_NUMITEMS,
+    "nav_list": API_NAV_LIST,
+    "navigate": API_NAVIGATE,
+    "selectItem": API_SELECT_ITEM,
+    "presets": API_PRESETS,
+    "selectPreset": API_SELECT_PRESET,
 }
 
+# notifications report node names in lower case
+_NODE_BY_LOWER_NAME = {node.lower(): node for node in API.values()}
+
+# a plain dict lookup is much cheaper than calling the enum class
+_PLAY_STATE_BY_VALUE = {state.value: state for state in PlayState}
+
 LOGGER = logging.getLogger(__name__)
 
+T = t.TypeVar("T")
+
 # pylint: disable=R0904
 
 
@@ -108,65 +188,200 @@ class AFSAPI:
         webfsapi_endpoint: str,
         pin: t.Union[str, int],
         timeout: int = DEFAULT_TIMEOUT_IN_SECONDS,
+        sid: t.Optional[str] = None,
+        session: t.Optional[aiohttp.ClientSession] = None,
     ):
-        """Initialize the Frontier Silicon device."""
+        """Initialize the Frontier Silicon device.
+
+        A session id stored from a previous run can be passed as `sid` to skip
+        CREATE_SESSION; it is renewed automatically once the device rejects it. Concurrent
+        calls that hit the stale session share a single renewal.
+
+        An aiohttp `session` shared with other code can be passed in as well, it
+        is used for all calls but left open by `close`.
+        """
         self.webfsapi_endpoint = webfsapi_endpoint
-        self.pin = str(pin)
         self.timeout = timeout
-
-        self.sid: t.Optional[str] = None
+        # passed with every request, as a shared session has its own default
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        self._pin = str(pin)
+        self._sid = sid
+        # renewing the session invalidates the previous one, so only one call may do it at a time
+        self.__session_lock = asyncio.Lock()
+        self._base_params: t.Dict[str, DataItem] = {}
+        self._update_base_params()
         self.__volume_steps: t.Optional[int] = None
+        self.__friendly_name: t.Optional[str] = None
+        self.__version: t.Optional[str] = None
+        self.__radio_id: t.Optional[str] = None
 
-        self.__modes = None
-        self.__equalisers = None
+        self.__modes: t.Optional[t.List[PlayerMode]] = None
+        self.__modes_by_key: t.Dict[str, PlayerMode] = {}
+        self.__equalisers: t.Optional[t.List[Equaliser]] = None
+        self.__equalisers_by_key: t.Dict[str, Equaliser] = {}
 
         self._current_nav_path: list[int] = []
+        # whether the device is known to be in navigation mode
+        self._nav_enabled = False
 
         self.__throttler = Throttler()
+        # long-polling for notifications must not hold up the other calls
+        self.__notify_throttler = Throttler()
+        self._session = session
+        self._owns_session = session is None
+
+    @property
+    def webfsapi_endpoint(self) -> str:
+        return self._webfsapi_endpoint
+
+    @webfsapi_endpoint.setter
+    def webfsapi_endpoint(self, value: str) -> None:
+        self._webfsapi_endpoint = value
+
+        # keep the parsed URLs of calls, so aiohttp doesn't parse the same string for every
+        # request. Bounded, as list pages add a path per start index.
+        url_prefix = value + "/"
+        self._url: t.Callable[[str], URL] = functools.lru_cache(maxsize=URL_CACHE_SIZE)(
+            lambda path: URL(url_prefix + path)
+        )
+
+    @property
+    def pin(self) -> str:
+        return self._pin
+
+    @pin.setter
+    def pin(self, value: str) -> None:
+        self._pin = value
+        self._update_base_params()
+
+    @property
+    def sid(self) -> t.Optional[str]:
+        return self._sid
+
+    @sid.setter
+    def sid(self, value: t.Optional[str]) -> None:
+        self._sid = value
+        self._update_base_params()
+
+    def _update_base_params(self) -> None:
+        """Rebuild the query parameters shared by every call, so reads can reuse them as-is."""
+        self._base_params = dict(pin=self._pin)
+        if self._sid:
+            self._base_params.update(sid=self._sid)
+
+    async def __aenter__(self) -> "AFSAPI":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: t.Optional[t.Type[BaseException]],
+        exc: t.Optional[BaseException],
+        tb: t.Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    @staticmethod
+    def _create_client_session(timeout: int) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=CONNECTION_POOL_LIMIT,
+                keepalive_timeout=KEEPALIVE_TIMEOUT_IN_SECONDS,
+            ),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it on first use."""
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = self._create_client_session(self.timeout)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session and release its pooled connections.
+
+        A session that was passed in is left open for its owner to close.
+        """
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
 
     @staticmethod
     async def get_webfsapi_endpoint(
-        fsapi_device_url: str, timeout: int = DEFAULT_TIMEOUT_IN_SECONDS
+        fsapi_device_url: str,
+        timeout: int = DEFAULT_TIMEOUT_IN_SECONDS,
+        session: t.Optional[aiohttp.ClientSession] = None,
     ) -> str:
+        if session is None:
+            async with AFSAPI._create_client_session(timeout) as client:
+                return await AFSAPI.get_webfsapi_endpoint(
+                    fsapi_device_url, timeout, client
+                )
 
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(force_close=True),
-            timeout=aiohttp.ClientTimeout(total=timeout),
-        ) as client:
-            try:
-                resp = await client.get(fsapi_device_url)
-                doc = ET.fromstring(await resp.text(encoding="utf-8"))
-
-                api = doc.find("webfsapi")
-                if api is not None and api.text:
-                    return api.text
-                else:
-                    raise FSApiException(
-                        f"Could not retrieve webfsapi endpoint from {fsapi_device_url}"
-                    )
+        try:
+            resp = await session.get(
+                fsapi_device_url, timeout=aiohttp.ClientTimeout(total=timeout)
+            )
+            doc = ET.fromstring(await resp.read())
 
-            except (aiohttp.ServerTimeoutError, asyncio.TimeoutError):
-                raise ConnectionError(
-                    f"Did not get a response in time from {fsapi_device_url}"
+            api = doc.find("webfsapi")
+            if api is not None and api.text:
+                return api.text
+            else:
+                raise FSApiException(
+                    f"Could not retrieve webfsapi endpoint from {fsapi_device_url}"
                 )
-            except aiohttp.ClientConnectionError:
-                raise ConnectionError(f"Could not connect to {fsapi_device_url}")
+
+        except (aiohttp.ServerTimeoutError, asyncio.TimeoutError):
+            raise TimeoutException(
+                f"Did not get a response in time from {fsapi_device_url}"
+            )
+        except aiohttp.ClientConnectionError:
+            raise ConnectionError(f"Could not connect to {fsapi_device_url}")
 
     @staticmethod
     async def create(
         fsapi_device_url: str,
         pin: t.Union[str, int],
         timeout: int = DEFAULT_TIMEOUT_IN_SECONDS,
+        sid: t.Optional[str] = None,
+        session: t.Optional[aiohttp.ClientSession] = None,
     ) -> "AFSAPI":
-        webfsapi_endpoint = await AFSAPI.get_webfsapi_endpoint(
-            fsapi_device_url, timeout
-        )
+        if session is not None:
+            webfsapi_endpoint = await AFSAPI.get_webfsapi_endpoint(
+                fsapi_device_url, timeout, session
+            )
+            return AFSAPI(webfsapi_endpoint, pin, timeout, sid, session)
 
-        return AFSAPI(webfsapi_endpoint, pin, timeout)
+        # the connection used to look up the endpoint is kept for the API calls
+        own_session = AFSAPI._create_client_session(timeout)
+        try:
+            webfsapi_endpoint = await AFSAPI.get_webfsapi_endpoint(
+                fsapi_device_url, timeout, own_session
+            )
+        except BaseException:
+            await own_session.close()
+            raise
+
+        afsapi = AFSAPI(webfsapi_endpoint, pin, timeout, sid)
+        afsapi._session = own_session
+        return afsapi
 
     # http request helpers
+    async def _renew_session(self, stale_sid: t.Optional[str]) -> None:
+        """Replace the session the device rejected for a call made with `stale_sid`.
+
+        Concurrent calls all fail on the same stale session. Only the first one creates
+        a new session, the others find the sid already changed and just retry with it.
+        """
+        async with self.__session_lock:
+            if self._sid == stale_sid:
+                self.sid = await self._create_session()
+
     async def _create_session(self) -> t.Optional[str]:
         self.sid = None
+        # navigation mode is bound to the session
+        self._nav_enabled = False
         return unpack_xml(
             await self.__call("CREATE_SESSION", retry_with_session=False), "sessionId"
         )
@@ -174,83 +389,160 @@ class AFSAPI:
     async def __call(
         self,
         path: str,
-        extra: t.Optional[t.Dict[str, DataItem]] = None,
-        force_new_session: bool = False,
+        extra: t.Optional[CallParams] = None,
         retry_with_session: bool = True,
         throttle_wait_after_call: float = TIME_AFTER_READ_CALLS_IN_SECONDS,
+        throttler: t.Optional[Throttler] = None,
+        timeout: t.Optional[aiohttp.ClientTimeout] = None,
     ) -> ET.Element:
         """Execute a frontier silicon API call."""
+        body = await self.__fetch(
+            path,
+            extra,
+            retry_with_session,
+            throttle_wait_after_call,
+            throttler,
+            timeout,
+        )
+        return self.__parse(path, body)
 
-        params: t.Dict[str, DataItem] = dict(pin=self.pin)
-
-        if force_new_session:
-            self.sid = await self._create_session()
-        if self.sid:
-            params.update(sid=self.sid)
-
-        if extra:
-            params.update(**extra)
+    async def __fetch(
+        self,
+        path: str,
+        extra: t.Optional[CallParams] = None,
+        retry_with_session: bool = True,
+        throttle_wait_after_call: float = TIME_AFTER_READ_CALLS_IN_SECONDS,
+        throttler: t.Optional[Throttler] = None,
+        timeout: t.Optional[aiohttp.ClientTimeout] = None,
+        reconnect: bool = True,
+    ) -> bytes:
+        """Execute a frontier silicon API call and return the raw response body."""
+
+        # the session the params are built with, to tell whether it was renewed meanwhile
+        sid = self._sid
+        params: CallParams
+        if not extra:
+            params = self._base_params
+        elif isinstance(extra, dict):
+            params = {**self._base_params, **extra}
+        else:
+            # a list of pairs is used when a parameter needs to be repeated
+            params = [*self._base_params.items(), *extra]
+
+        client = await self._get_session()
+
+        try:
+            async with (throttler or self.__throttler).throttle(
+                throttle_wait_after_call
+            ):
+                result = await client.get(
+                    self._url(path),
+                    params=params,
+                    timeout=timeout if timeout is not None else self._client_timeout,
+                )
 
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(force_close=True),
-            timeout=aiohttp.ClientTimeout(total=self.timeout),
-        ) as client:
+            # read the body and hand the connection back to the pool right away,
+            # also for error responses that are not parsed any further
             try:
-                async with self.__throttler.throttle(throttle_wait_after_call):
-                    result = await client.get(
-                        f"{self.webfsapi_endpoint}/{path}", params=params
-                    )
-
-                LOGGER.debug(f"Called {path} with {params}: {result.status}")
-
-                if result.status == 403:
-                    raise InvalidPinException("Access denied - incorrect PIN")
-                elif result.status == 404:
-                    # Bad session ID or service endpoint
-                    logging.warn(
-                        f"Service call failed with 404 to {self.webfsapi_endpoint}/{path}"
-                    )
+                body = await result.read()
+            finally:
+                result.release()
+
+            LOGGER.debug("Called %s with %s: %s", path, params, result.status)
+
+            if result.status == 403:
+                raise InvalidPinException("Access denied - incorrect PIN")
+            elif result.status == 404:
+                # Bad session ID or service endpoint
+                LOGGER.warning(
+                    "Service call failed with 404 to %s/%s",
+                    self.webfsapi_endpoint,
+                    path,
+                )
 
-                    if not force_new_session and retry_with_session:
-                        # retry command with a forced new session
-                        return await self.__call(path, extra, force_new_session=True)
-                    else:
-                        raise InvalidSessionException(
-                            "Wrong session-id or invalid command"
-                        )
-                elif result.status != 200:
-                    raise FSApiException(
-                        f"Unexpected result {result.status}: {await result.text()}"
-                    )
-                doc = ET.fromstring(await result.text(encoding="utf-8"))
-                status = unpack_xml(doc, "status")
-
-                if status == "FS_OK" or status == "FS_LIST_END":
-                    return doc
-                elif status == "FS_NODE_DOES_NOT_EXIST":
-                    raise NotImplementedException(
-                        f"FSAPI service {path} not implemented at {self.webfsapi_endpoint}."
-                    )
-                elif status == "FS_NODE_BLOCKED":
-                    raise FSApiException("Device is not in the correct mode")
-                elif status == "FS_FAIL":
-                    raise OutOfRangeException(
-                        "Command failed. Value is not in range for this command."
+                if retry_with_session:
+                    # retry command with a new session, unless another call already renewed it
+                    await self._renew_session(sid)
+                    return await self.__fetch(
+                        path,
+                        extra,
+                        retry_with_session=False,
+                        throttle_wait_after_call=throttle_wait_after_call,
+                        throttler=throttler,
+                        timeout=timeout,
                     )
-                elif status == "FS_PACKET_BAD":
-                    raise FSApiException("This command can't be SET")
-
-                logging.error(f"Unexpected FSAPI status {status}")
-                raise FSApiException(f"Unexpected FSAPI status '{status}'")
-            except aiohttp.ClientConnectionError:
-                raise ConnectionError(f"Could not connect to {self.webfsapi_endpoint}")
-            except TimeoutError:
-                if not force_new_session and retry_with_session:
-                    return await self.__call(path, extra, force_new_session=True)
                 else:
-                    raise ConnectionError(
-                        f"{self.webfsapi_endpoint} did not respond within {self.timeout} seconds"
-                    )
+                    raise InvalidSessionException("Wrong session-id or invalid command")
+            elif result.status != 200:
+                raise FSApiException(
+                    f"Unexpected result {result.status}: {body.decode(errors='replace')}"
+                )
+            return body
+        except aiohttp.ServerDisconnectedError:
+            if reconnect and path.partition("/")[0] in _READ_OPERATIONS:
+                # the connection was closed before the answer arrived, be it a kept-alive
+                # one the device dropped or one closed while the call was processed. Only
+                # reads are safe to send again, a SET may already have been executed.
+                return await self.__fetch(
+                    path,
+                    extra,
+                    retry_with_session,
+                    throttle_wait_after_call,
+                    throttler,
+                    timeout,
+                    reconnect=False,
+                )
+            raise ConnectionError(f"Could not connect to {self.webfsapi_endpoint}")
+        except aiohttp.ClientConnectionError:
+            raise ConnectionError(f"Could not connect to {self.webfsapi_endpoint}")
+        except TimeoutError as err:
+            # the device may have received the call and just been slow, so as above
+            # only reads are sent again
+            if retry_with_session and path.partition("/")[0] in _READ_OPERATIONS:
+                await self._renew_session(sid)
+                return await self.__fetch(
+                    path,
+                    extra,
+                    retry_with_session=False,
+                    throttle_wait_after_call=throttle_wait_after_call,
+                    throttler=throttler,
+                    timeout=timeout,
+                )
+            else:
+                raise TimeoutException(
+                    f"{self.webfsapi_endpoint} did not respond within {self.timeout} seconds"
+                ) from err
+
+    def __parse(self, path: str, body: bytes) -> ET.Element:
+        """Parse the response of a frontier silicon API call and check its status."""
+        # the XML declaration carries the encoding, so parse the raw bytes
+        doc = ET.fromstring(body)
+        if doc.tag == "fsapiGetMultipleResponse":
+            # statuses are reported per node, see handle_get_multiple
+            return doc
+
+        status = unpack_xml(doc, "status")
+
+        if status == "FS_OK" or status == "FS_LIST_END":
+            return doc
+        elif status == "FS_TIMEOUT" and path == "GET_NOTIFIES":
+            # nothing changed while the device held the request
+            return doc
+        elif status == "FS_NODE_DOES_NOT_EXIST":
+            raise NotImplementedException(
+                f"FSAPI service {path} not implemented at {self.webfsapi_endpoint}."
+            )
+        elif status == "FS_NODE_BLOCKED":
+            raise NodeBlockedException("Device is not in the correct mode")
+        elif status == "FS_FAIL":
+            raise OutOfRangeException(
+                "Command failed. Value is not in range for this command."
+            )
+        elif status == "FS_PACKET_BAD":
+            raise FSApiException("This command can't be SET")
+
+        LOGGER.error("Unexpected FSAPI status %s", status)
+        raise FSApiException(f"Unexpected FSAPI status '{status}'")
 
     # Helper methods
 
@@ -259,6 +551,64 @@ class AFSAPI:
     async def handle_get(self, item: str) -> ET.Element:
         return await self.__call(f"GET/{item}")
 
+    async def handle_get_multiple(
+        self, items: t.Sequence[str]
+    ) -> t.Dict[str, t.Optional[DataItem]]:
+        """Get the values of several nodes with a single GET_MULTIPLE request.
+
+        Nodes the device could not return are mapped to None.
+        """
+        doc = await self.__call("GET_MULTIPLE", [("node", item) for item in items])
+
+        # the device does not necessarily echo the node names with the same case
+        requested = {item.lower(): item for item in items}
+        values: t.Dict[str, t.Optional[DataItem]] = dict.fromkeys(items)
+        for response in doc.iterfind("fsapiResponse"):
+            node = response.findtext("node")
+            value = response.find("value")
+            if node is None or value is None or response.findtext("status") != "FS_OK":
+                continue
+
+            values[requested.get(node.lower(), node)] = self._unpack_value(value)
+
+        return values
+
+    async def handle_notifies(
+        self,
+    ) -> t.AsyncIterator[t.Tuple[str, t.Optional[DataItem]]]:
+        """Wait for the device to report changes and yield them as (node, value) pairs.
+
+        The device holds a GET_NOTIFIES request until a value changes, so nothing is
+        polled in between. A request that times out on the device yields nothing.
+        """
+        # a long-poll running into the client timeout doesn't mean the session is bad,
+        # renewing it would only reset the navigation state and log out other users
+        doc = await self.__call(
+            "GET_NOTIFIES",
+            retry_with_session=False,
+            throttler=self.__notify_throttler,
+            timeout=_NOTIFY_CLIENT_TIMEOUT,
+        )
+
+        for notify in doc.iterfind("notify"):
+            node = notify.get("node")
+            value = notify.find("value")
+            if node is None or value is None:
+                continue
+
+            yield _NODE_BY_LOWER_NAME.get(node.lower(), node), self._unpack_value(value)
+
+    @staticmethod
+    def _unpack_value(value: ET.Element) -> t.Optional[DataItem]:
+        """Convert a <value> element to text or an integer depending on its type."""
+        if len(value) == 0:
+            return None
+
+        leaf = value[0]
+        if leaf.tag == "c8_array":
+            return leaf.text
+        return int(leaf.text) if leaf.text is not None else None
+
     async def handle_set(
         self,
         item: str,
@@ -273,26 +623,40 @@ class AFSAPI:
             ),
             "status",
         )
-        return maybe(status, lambda x: x == "FS_OK")
+        return status == "FS_OK" if status is not None else None
 
     async def handle_text(self, item: str) -> t.Optional[str]:
-        return unpack_xml(await self.handle_get(item), "value/c8_array")
+        return unpack_value(
+            await self.handle_get(item), VALUE_TYPE_TO_XML_PATH[FSApiValueType.TEXT]
+        )
+
+    async def _handle_number(
+        self, item: str, value_type: FSApiValueType
+    ) -> t.Optional[int]:
+        tag = VALUE_TYPE_TO_XML_PATH[value_type]
+        path = f"GET/{item}"
+        body = await self.__fetch(path)
+
+        val = unpack_number(body, tag.encode())
+        if val is not None:
+            return val
+
+        # unusual response or error status, let the parser deal with it
+        text = unpack_value(self.__parse(path, body), tag)
+        return int(text) if text is not None else None
 
     async def handle_int(self, item: str) -> t.Optional[int]:
-        val = unpack_xml(await self.handle_get(item), "value/u8")
-        return maybe(val, int)
+        return await self._handle_number(item, FSApiValueType.INT)
 
     # returns an int, assuming the value does not exceed 8 bits
     async def handle_long(self, item: str) -> t.Optional[int]:
-        val = unpack_xml(await self.handle_get(item), "value/u32")
-        return maybe(val, int)
+        return await self._handle_number(item, FSApiValueType.LONG)
 
     async def handle_signed_long(
         self,
         item: str,
     ) -> t.Optional[int]:
-        val = unpack_xml(await self.handle_get(item), "value/s32")
-        return maybe(val, int)
+        return await self._handle_number(item, FSApiValueType.SIGNED_LONG)
 
     async def handle_list(
         self, list_name: str
@@ -302,32 +666,38 @@ class AFSAPI:
         ) -> t.Tuple[str, t.Dict[str, t.Optional[DataItem]]]:
             key = item.attrib["key"]
 
-            def _handle_field(field: ET.Element) -> t.Tuple[str, t.Optional[DataItem]]:
+            value: t.Dict[str, t.Optional[DataItem]] = {}
+            for field in item.iterfind("field"):
+                id = field.get("name")
+                if id is None:
+                    raise ValueError("Invalid field")
+
                 # TODO: Handle other field types
-                if "name" in field.attrib:
-                    id = field.attrib["name"]
-                    s = unpack_xml(field, "c8_array")
-                    v = maybe(unpack_xml(field, "u8"), int)
-                    return (id, s or v)
-                raise ValueError("Invalid field")
-
-            value = dict(map(_handle_field, item.findall("field")))
+                s: t.Optional[str] = None
+                v: t.Optional[int] = None
+                for child in field:
+                    if child.tag == "c8_array":
+                        s = child.text
+                    elif child.tag == "u8" and child.text:
+                        v = int(child.text)
+                value[id] = s or v
+
             return key, value
 
         async def _get_next_items(
             start: int, count: int
-        ) -> t.Tuple[list[ET.Element], bool]:
+        ) -> t.Tuple[t.Iterable[ET.Element], bool]:
             try:
                 doc = await self.__call(
                     f"LIST_GET_NEXT/{list_name}/{start}", {"maxItems": count}
                 )
 
-                if doc and unpack_xml(doc, "status") == "FS_OK":
-                    return doc.findall("item"), doc.find("listend") is not None
+                if unpack_xml(doc, "status") == "FS_OK":
+                    return doc.iterfind("item"), doc.find("listend") is not None
                 else:
-                    return [], True
+                    return (), True
             except OutOfRangeException:
-                return [], True
+                return (), True
 
         start = -1
         count = 50  # asking for more items gives a bigger chance on FS_NODE_BLOCKED errors on subsequent requests
@@ -347,27 +717,40 @@ class AFSAPI:
     # sys
     async def get_friendly_name(self) -> t.Optional[str]:
         """Get the friendly name of the device."""
-        return await self.handle_text(API["friendly_name"])
+        # Cache as this only changes through set_friendly_name
+        if self.__friendly_name is None:
+            self.__friendly_name = await self.handle_text(API_FRIENDLY_NAME)
+
+        return self.__friendly_name
 
     async def set_friendly_name(self, value: str) -> t.Optional[bool]:
         """Set the friendly name of the device."""
-        return await self.handle_set(API["friendly_name"], value)
+        self.__friendly_name = None
+        return await self.handle_set(API_FRIENDLY_NAME, value)
 
     async def get_version(self) -> t.Optional[str]:
         """Get the friendly name of the device."""
-        return await self.handle_text(API["version"])
+        # Cache as this never changes
+        if self.__version is None:
+            self.__version = await self.handle_text(API_VERSION)
+
+        return self.__version
 
     async def get_radio_id(self) -> t.Optional[str]:
         """Get the friendly name of the device."""
-        return await self.handle_text(API["radio_id"])
+        # Cache as this never changes
+        if self.__radio_id is None:
+            self.__radio_id = await self.handle_text(API_RADIO_ID)
+
+        return self.__radio_id
 
     async def get_mac(self) -> t.Optional[str]:
         """Get the MAC address of the device."""
-        on_wlan = await self.handle_int(API["wlan_active"])
+        on_wlan = await self.handle_int(API_WLAN_ACTIVE)
         if bool(on_wlan):
-            return await self.handle_text(API["wlan_mac"])
+            return await self.handle_text(API_WLAN_MAC)
         else:
-            return await self.handle_text(API["wired_mac"])
+            return await self.handle_text(API_WIRED_MAC)
 
     async def get_rssi(self) -> t.Optional[int]:
         """Get the current wlan Received Signal Strength Indication in dBm"""
@@ -376,7 +759,7 @@ class AFSAPI:
         # -80dBm (0%) and -20dBm (100%).  100% indicates a wired
         # connection.  This functions returns the dBm value of RSSI.
 
-        rssi = await self.handle_int(API["rssi"])
+        rssi = await self.handle_int(API_RSSI)
         if rssi is not None:
             return int(round(rssi * 0.6 - 80))
         else:
@@ -384,96 +767,222 @@ class AFSAPI:
 
     async def get_power(self) -> t.Optional[bool]:
         """Check if the device is on."""
-        power = await self.handle_int(API["power"])
-        return bool(power)
+        power = await self.handle_int(API_POWER)
+        return None if power is None else power == 1
 
     async def set_power(self, value: bool = False) -> t.Optional[bool]:
         """Power on or off the device."""
-        power = await self.handle_set(
-            API["power"],
+        return await self.handle_set(
+            API_POWER,
             int(value),
             throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
         )
-        return bool(power)
 
     async def get_volume_steps(self) -> t.Optional[int]:
         """Read the maximum volume level of the device."""
         if not self.__volume_steps:
-            self.__volume_steps = await self.handle_int(API["volume_steps"])
+            self.__volume_steps = await self.handle_int(API_VOLUME_STEPS)
 
         return self.__volume_steps
 
     # Volume
     async def get_volume(self) -> t.Optional[int]:
         """Read the volume level of the device."""
-        return await self.handle_int(API["volume"])
+        return await self.handle_int(API_VOLUME)
 
     async def set_volume(self, value: int) -> t.Optional[bool]:
         """Set the volume level of the device."""
-        return await self.handle_set(API["volume"], value)
+        return await self.handle_set(API_VOLUME, value)
 
     # Mute
     async def get_mute(self) -> t.Optional[bool]:
         """Check if the device is muted."""
-        mute = await self.handle_int(API["mute"])
-        return bool(mute)
+        mute = await self.handle_int(API_MUTE)
+        return None if mute is None else mute == 1
 
     async def set_mute(self, value: bool = False) -> t.Optional[bool]:
         """Mute or unmute the device."""
-        mute = await self.handle_set(API["mute"], int(value))
-        return bool(mute)
+        return await self.handle_set(API_MUTE, int(value))
 
     async def get_play_status(self) -> t.Optional[PlayState]:
         """Get the play status of the device."""
-        status = await self.handle_int(API["status"])
+        status = await self.handle_int(API_STATUS)
         if status:
-            return PlayState(status)
+            return _PLAY_STATE_BY_VALUE.get(status)
         else:
             return None
 
     async def get_play_name(self) -> t.Optional[str]:
         """Get the name of the played item."""
-        return await self.handle_text(API["name"])
+        return await self.handle_text(API_NAME)
 
     async def get_play_text(self) -> t.Optional[str]:
         """Get the text associated with the played media."""
-        return await self.handle_text(API["text"])
+        return await self.handle_text(API_TEXT)
 
     async def get_play_artist(self) -> t.Optional[str]:
         """Get the artists of the current media(song)."""
-        return await self.handle_text(API["artist"])
+        return await self.handle_text(API_ARTIST)
 
     async def get_play_album(self) -> t.Optional[str]:
         """Get the songs's album."""
-        return await self.handle_text(API["album"])
+        return await self.handle_text(API_ALBUM)
 
     async def get_play_graphic(self) -> t.Optional[str]:
         """Get the album art associated with the song/album/artist."""
-        return await self.handle_text(API["graphic_uri"])
+        return await self.handle_text(API_GRAPHIC_URI)
 
     # Shuffle
     async def get_play_shuffle(self) -> t.Optional[bool]:
-        status = await self.handle_int(API["shuffle"])
+        status = await self.handle_int(API_SHUFFLE)
         if status:
             return status == 1
         return None
 
     async def set_play_shuffle(self, value: bool) -> t.Optional[bool]:
-        return await self.handle_set(API["shuffle"], int(value))
+        return await self.handle_set(API_SHUFFLE, int(value))
 
     # Repeat
     async def get_play_repeat(self) -> t.Optional[bool]:
-        status = await self.handle_int(API["repeat"])
+        status = await self.handle_int(API_REPEAT)
         if status:
             return status == 1
         return None
 
     async def play_repeat(self, value: bool) -> t.Optional[bool]:
-        return await self.handle_set(API["repeat"], int(value))
+        return await self.handle_set(API_REPEAT, int(value))
 
     async def get_play_duration(self) -> t.Optional[int]:
         """Get the duration of the played media."""
-        return await self.handle_long(API["duration"])
+        return await self.handle_long(API_DURATION)
+
+    async def _gather_values(self, *getters: t.Awaitable[t.Any]) -> t.List[t.Any]:
+        """
+        Run getters concurrently and return their values in order.
+
+        A value the device cannot provide in its current mode ends up as None instead of
+        failing all of them, while connection and authentication errors are still raised.
+        If the device rejects the session, it is renewed once for all getters.
+        """
+        results = await asyncio.gather(*getters, return_exceptions=True)
+
+        def _value(result: t.Any) -> t.Any:
+            if isinstance(
+                result, (ConnectionError, InvalidPinException, InvalidSessionException)
+            ):
+                raise result
+            elif isinstance(result, (FSApiException, NotImplementedException)):
+                return None
+            elif isinstance(result, BaseException):
+                raise result
+            return result
+
+        return [_value(result) for result in results]
+
+    async def get_play_info_all(self) -> t.Dict[str, t.Any]:
+        """
+        Get all information about the played media at once.
+
+        The getters run concurrently, values the device cannot provide are None. Pollers
+        should use refresh() instead, which reads the same values in a single request.
+        """
+        status, name, text, artist, album, graphic, duration = (
+            await self._gather_values(
+                self.get_play_status(),
+                self.get_play_name(),
+                self.get_play_text(),
+                self.get_play_artist(),
+                self.get_play_album(),
+                self.get_play_graphic(),
+                self.get_play_duration(),
+            )
+        )
+        return dict(
+            status=status,
+            name=name,
+            text=text,
+            artist=artist,
+            album=album,
+            graphic=graphic,
+            duration=duration,
+        )
+
+    async def get_state_bundle(self) -> DeviceState:
+        """
+        Get the media information of get_play_info_all with position, volume and mute state.
+
+        Values the device cannot provide are None, as in get_play_info_all. Pollers should
+        use refresh(), and this only where the firmware does not support GET_MULTIPLE.
+        """
+        info, (position, volume, mute) = await asyncio.gather(
+            self.get_play_info_all(),
+            self._gather_values(
+                self.get_play_position(), self.get_volume(), self.get_mute()
+            ),
+        )
+        return DeviceState(**info, position=position, volume=volume, mute=mute)
+
+    async def refresh(self) -> t.Dict[str, t.Any]:
+        """
+        Get power, volume, mute and all information about the played media at once.
+
+        Everything is read with a single GET_MULTIPLE request instead of one request per value,
+        which makes this the call pollers should use. Values the device cannot provide are None,
+        as in get_play_info_all and get_state_bundle.
+        """
+        values = await self.handle_get_multiple(
+            [
+                API_POWER,
+                API_VOLUME,
+                API_MUTE,
+                API_STATUS,
+                API_NAME,
+                API_TEXT,
+                API_ARTIST,
+                API_ALBUM,
+                API_GRAPHIC_URI,
+                API_DURATION,
+            ]
+        )
+        power, mute, status = values[API_POWER], values[API_MUTE], values[API_STATUS]
+        return dict(
+            power=None if power is None else power == 1,
+            volume=values[API_VOLUME],
+            mute=None if mute is None else mute == 1,
+            status=_PLAY_STATE_BY_VALUE.get(int(status)) if status else None,
+            name=values[API_NAME],
+            text=values[API_TEXT],
+            artist=values[API_ARTIST],
+            album=values[API_ALBUM],
+            graphic=values[API_GRAPHIC_URI],
+            duration=values[API_DURATION],
+        )
+
+    async def watch(self) -> t.AsyncIterator[t.Tuple[str, t.Optional[DataItem]]]:
+        """
+        Yield (node, value) pairs whenever the device reports a changed value.
+
+        This keeps a GET_NOTIFIES long-poll open instead of polling the getters, and runs
+        until the caller stops iterating. Node names are the API_* constants of this module.
+        """
+        renewed = False
+        while True:
+            sid = self._sid
+            try:
+                async for change in self.handle_notifies():
+                    yield change
+            except TimeoutException:
+                # the poll ran into the client timeout, just open the next one
+                pass
+            except InvalidSessionException:
+                # renew a session the device no longer knows, but only once in a row
+                if renewed:
+                    raise
+                await self._renew_session(sid)
+                renewed = True
+                continue
+
+            renewed = False
 
     async def get_play_position(self) -> t.Optional[int]:
         """
@@ -483,10 +992,10 @@ class AFSAPI:
 
         To find the upper bound for the current track, use `get_play_duration`
         """
-        return await self.handle_int(API["position"])
+        return await self.handle_int(API_POSITION)
 
     async def set_play_position(self, value: int) -> t.Optional[bool]:
-        return await self.handle_set(API["position"], value)
+        return await self.handle_set(API_POSITION, value)
 
     # Play  rate
     async def get_play_rate(self) -> t.Optional[int]:
@@ -499,11 +1008,11 @@ class AFSAPI:
         * 2 to 127: The track will be fast forwarded, the speed is here also dependable of the value
           The speed of the fast forward is also dependable of the value, 80 is faster than 10
         """
-        return await self.handle_int(API["rate"])
+        return await self.handle_int(API_RATE)
 
     async def set_play_rate(self, value: int) -> t.Optional[bool]:
         if -127 <= value <= 127:
-            return await self.handle_set(API["rate"], value)
+            return await self.handle_set(API_RATE, value)
         else:
             raise ValueError("Play rate must be within values -127 to 127")
 
@@ -515,7 +1024,7 @@ class AFSAPI:
 
         1=Play; 2=Pause; 3=Next; 4=Previous (song/station)
         """
-        return await self.handle_set(API["control"], int(value))
+        return await self.handle_set(API_CONTROL, int(value))
 
     async def play(self) -> t.Optional[bool]:
         """Play media."""
@@ -540,52 +1049,54 @@ class AFSAPI:
         if self.__equalisers is None:
             self.__equalisers = [
                 Equaliser(key=key, **eqinfo)  # type: ignore
-                async for key, eqinfo in self.handle_list(API["equalisers"])
+                async for key, eqinfo in self.handle_list(API_EQUALISERS)
             ]
+            self.__equalisers_by_key = {eq.key: eq for eq in self.__equalisers}
 
-        return self.__equalisers  # type: ignore
+        return self.__equalisers
 
     # EQ Presets
     async def get_eq_preset(self) -> t.Optional[Equaliser]:
-        v = await self.handle_int(API["eqpreset"])
+        v = await self.handle_int(API_EQPRESET)
         if v is None:
             return None
 
-        for eq in await self.get_equalisers():
-            if eq.key == str(v):
-                return eq
+        await self.get_equalisers()
+        eq = self.__equalisers_by_key.get(str(v))
+        if eq is not None:
+            return eq
 
         raise FSApiException(f"Could not retrieve equaliser {v} in equaliser list")
 
     async def set_eq_preset(self, value: t.Union[Equaliser, int]) -> t.Optional[bool]:
         return await self.handle_set(
-            API["eqpreset"],
+            API_EQPRESET,
             int(value.key) if isinstance(value, Equaliser) else value,
         )
 
     # EQ Loudness (Only works with My EQ!)
     async def get_eq_loudness(self) -> bool:
-        return bool(await self.handle_int(API["eqloudness"]))
+        return bool(await self.handle_int(API_EQLOUDNESS))
 
     async def set_eq_loudness(self, value: bool) -> t.Optional[bool]:
-        return await self.handle_set(API["eqloudness"], int(value))
+        return await self.handle_set(API_EQLOUDNESS, int(value))
 
     # Bass and Treble
     async def get_bass(self) -> t.Optional[int]:
-        return await self.handle_int(API["bass"])
+        return await self.handle_int(API_BASS)
 
     async def set_bass(self, value: bool) -> t.Optional[bool]:
         if -14 <= value <= 14:
-            return await self.handle_set(API["bass"], int(value))
+            return await self.handle_set(API_BASS, int(value))
         else:
             raise ValueError("Outside of bounds: [-14, 14]")
 
     async def get_treble(self) -> t.Optional[int]:
-        return await self.handle_int(API["treble"])
+        return await self.handle_int(API_TREBLE)
 
     async def set_treble(self, value: bool) -> t.Optional[bool]:
         if -14 <= value <= 14:
-            return await self.handle_set(API["treble"], int(value))
+            return await self.handle_set(API_TREBLE, int(value))
         else:
             raise ValueError("Outside of bounds: [-14, 14]")
 
@@ -593,7 +1104,7 @@ class AFSAPI:
     async def _get_modes(
         self,
     ) -> t.AsyncIterable[t.Tuple[str, t.Dict[str, t.Optional[DataItem]]]]:
-        async for mode in self.handle_list(API["valid_modes"]):
+        async for mode in self.handle_list(API_VALID_MODES):
             yield mode
 
     async def get_modes(self) -> t.List[PlayerMode]:
@@ -605,47 +1116,53 @@ class AFSAPI:
                 PlayerMode(key=k, **v)  # type: ignore
                 async for k, v in self._get_modes()
             ]
+            self.__modes_by_key = {mode.key: mode for mode in self.__modes}
 
-        return self.__modes  # type: ignore
+        return self.__modes
 
     async def get_mode(self) -> t.Optional[PlayerMode]:
         """Get the currently active mode on the device (DAB, FM, Spotify)."""
-        int_mode = await self.handle_long(API["mode"])
+        int_mode = await self.handle_long(API_MODE)
         if int_mode is None:
             return None
 
-        for mode in await self.get_modes():
-            if mode.key == str(int_mode):
-                return mode
+        await self.get_modes()
+        mode = self.__modes_by_key.get(str(int_mode))
+        if mode is not None:
+            return mode
 
         raise FSApiException(f"Could not retrieve mode {int_mode} in modes list")
 
     async def set_mode(self, value: t.Union[PlayerMode, str]) -> t.Optional[bool]:
         """Set the currently active mode on the device (DAB, FM, Spotify)."""
         result = await self.handle_set(
-            API["mode"],
+            API_MODE,
             value.key if isinstance(value, PlayerMode) else value,
             throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
         )
         self._current_nav_path = []
+        self._nav_enabled = False
         return result
 
     # Sleep
     async def get_sleep(self) -> t.Optional[int]:
         """Check when and if the device is going to sleep."""
-        return await self.handle_long(API["sleep"])
+        return await self.handle_long(API_SLEEP)
 
     async def set_sleep(self, value: int = 0) -> t.Optional[bool]:
         """Set device sleep timer."""
-        return await self.handle_set(API["sleep"], int(value))
+        return await self.handle_set(API_SLEEP, int(value))
 
     # Folder navigation
 
     async def _enable_nav_if_necessary(self) -> None:
-        nav_state = await self.handle_int(API["nav_state"])
+        if self._nav_enabled:
+            return
+
+        nav_state = await self.handle_int(API_NAV_STATE)
         if nav_state != 1:
             await self.handle_set(
-                API["nav_state"],
+                API_NAV_STATE,
                 1,
                 throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
                 # changing to navigation can be very slow!
@@ -654,72 +1171,122 @@ class AFSAPI:
             # the nav path is empty, as we needed to set the radio into nav-mode
             self._current_nav_path = []
 
-    async def nav_get_numitems(self) -> t.Optional[int]:
+        self._nav_enabled = True
+
+    async def _nav_call(
+        self, call: t.Callable[[], t.Awaitable[T]], in_current_folder: bool = True
+    ) -> T:
+        """
+        Run a call that needs navigation mode, enabling it again if the device left it.
+
+        Enabling navigation mode starts over in the root folder, so a call `in_current_folder`
+        is only repeated when it was made in the root folder. Otherwise NodeBlockedException
+        is raised, and the next call enables navigation mode again.
+        """
         await self._enable_nav_if_necessary()
-        return await self.handle_signed_long(API["numitems"])
+        repeatable = not (in_current_folder and self._current_nav_path)
+        try:
+            return await call()
+        except NodeBlockedException:
+            # the mode was changed on the device itself, e.g. on its front panel or by another app
+            self._nav_enabled = False
+            if not repeatable:
+                raise
+
+            await self._enable_nav_if_necessary()
+            return await call()
+
+    async def _nav_list(
+        self, list_name: str, in_current_folder: bool = True
+    ) -> t.AsyncIterator[t.Tuple[str, t.Dict[str, t.Optional[DataItem]]]]:
+        """List a node that needs navigation mode, enabling it again as _nav_call does."""
+        await self._enable_nav_if_necessary()
+        repeatable = not (in_current_folder and self._current_nav_path)
+        started = False
+        try:
+            async for item in self.handle_list(list_name):
+                started = True
+                yield item
+        except NodeBlockedException:
+            self._nav_enabled = False
+            if started or not repeatable:
+                raise
+
+            await self._enable_nav_if_necessary()
+            async for item in self.handle_list(list_name):
+                yield item
+
+    async def nav_get_numitems(self) -> t.Optional[int]:
+        return await self._nav_call(lambda: self.handle_signed_long(API_NUMITEMS))
 
     async def nav_list(
         self,
     ) -> t.AsyncIterable[t.Tuple[str, t.Dict[str, t.Optional[DataItem]]]]:
         await self._enable_nav_if_necessary()
-        return self.handle_list(API["nav_list"])
+        return self._nav_list(API_NAV_LIST)
 
     async def nav_select_folder(self, value: int) -> t.Optional[bool]:
-        await self._enable_nav_if_necessary()
-        result = await self.handle_set(
-            API["navigate"],
-            value,
-            throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
+        result = await self._nav_call(
+            lambda: self.handle_set(
+                API_NAVIGATE,
+                value,
+                throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
+            )
         )
         self._current_nav_path.append(value)
 
         return result
 
     async def nav_select_parent_folder(self) -> t.Optional[bool]:
-        await self._enable_nav_if_necessary()
-        result = await self.handle_set(
-            API["navigate"],
-            "0xffffffff",
-            throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
+        result = await self._nav_call(
+            lambda: self.handle_set(
+                API_NAVIGATE,
+                "0xffffffff",
+                throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
+            )
         )
         self._current_nav_path.pop()
 
         return result
 
     async def nav_select_item(self, value: int) -> t.Optional[bool]:
-        await self._enable_nav_if_necessary()
-        return await self.handle_set(
-            API["selectItem"],
-            value,
-            throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
+        return await self._nav_call(
+            lambda: self.handle_set(
+                API_SELECT_ITEM,
+                value,
+                throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
+            )
         )
 
     async def nav_reset(self) -> t.Optional[bool]:
         self._current_nav_path = []
-        return await self.handle_set(API["nav_state"], 0)
+        self._nav_enabled = False
+        return await self.handle_set(API_NAV_STATE, 0)
 
     async def nav_select_folder_via_path(self, path: list[int]) -> t.Optional[bool]:
         """Navigates to a target folder from the current folder in as litte steps as necessary."""
         result = None
 
+        # enabling navigation mode again starts over in the root folder, so do it before
+        # comparing the paths
+        await self._enable_nav_if_necessary()
+
         LOGGER.debug("Navigating to %s, currently in %s", path, self._current_nav_path)
 
-        while len(self._current_nav_path) > len(path):
+        # the folders both paths have in common can stay as they are
+        target = [int(key) for key in path]
+        common = 0
+        max_common = min(len(self._current_nav_path), len(target))
+        while common < max_common and self._current_nav_path[common] == target[common]:
+            common += 1
+
+        for _ in range(len(self._current_nav_path) - common):
             LOGGER.debug("Going up to parent folder in %s", self._current_nav_path)
             result = await self.nav_select_parent_folder()
 
-        key_idx = 0
-        while key_idx < len(path):
-            key = int(path[key_idx])
-            if key_idx >= len(self._current_nav_path):
-                LOGGER.debug("Selecting %s in %s", key, self._current_nav_path)
-                result = await self.nav_select_folder(key)
-                key_idx += 1
-            elif key != self._current_nav_path[key_idx]:
-                LOGGER.debug("Going up to parent folder in %s", self._current_nav_path)
-                result = await self.nav_select_parent_folder()
-            else:
-                key_idx += 1
+        for key in target[common:]:
+            LOGGER.debug("Selecting %s in %s", key, self._current_nav_path)
+            result = await self.nav_select_folder(key)
 
         return result
 
@@ -732,17 +1299,13 @@ class AFSAPI:
     async def _get_presets(
         self,
     ) -> t.AsyncIterable[t.Tuple[str, t.Dict[str, t.Optional[DataItem]]]]:
-        await self._enable_nav_if_necessary()
-
-        async for key, preset in self.handle_list(API["presets"]):
+        async for key, preset in self._nav_list(API_PRESETS, in_current_folder=False):
+            # Skip empty presets
             if preset.get("name"):
                 # Strip whitespaces from names
                 assert isinstance(preset["name"], str)
                 preset["name"] = preset["name"].strip()
                 yield key, preset
-            else:
-                # Skip empty preset
-                pass
 
     async def get_presets(self) -> t.List[Preset]:
 
@@ -761,9 +1324,11 @@ class AFSAPI:
         ]
 
     async def select_preset(self, value: t.Union[Preset, int]) -> t.Optional[bool]:
-        await self._enable_nav_if_necessary()
-        return await self.handle_set(
-            API["selectPreset"],
-            value.key if isinstance(value, Preset) else value,
-            throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
+        return await self._nav_call(
+            lambda: self.handle_set(
+                API_SELECT_PRESET,
+                value.key if isinstance(value, Preset) else value,
+                throttle_wait_after_call=TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS,
+            ),
+            in_current_folder=False,
         )
@@ -10,6 +10,10 @@ class ConnectionError(FSApiException):
     pass
 
 
+class TimeoutException(ConnectionError):
+    pass
+
+
 class OutOfRangeException(FSApiException):
     pass
 
@@ -20,3 +24,7 @@ class InvalidPinException(FSApiException):
 
 class InvalidSessionException(FSApiException):
     pass
+
+
+class NodeBlockedException(FSApiException):
+    pass
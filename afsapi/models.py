@@ -1,7 +1,11 @@
+import sys
 import typing as t
 from enum import IntEnum
 from dataclasses import dataclass
 
+# instances of the models are created for every list item, slots keep them small (python 3.10+)
+_SLOTS: t.Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class PlayState(IntEnum):
     STOPPED = 0
@@ -25,7 +29,7 @@ class PlayControl(IntEnum):
     """
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class PlayerMode:
     id: str
     label: str
@@ -35,14 +39,30 @@ class PlayerMode:
     modetype: t.Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Equaliser:
     key: str
     label: str
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Preset:
     key: int
     type: t.Optional[str] = None
     name: t.Optional[str] = None
+
+
+@dataclass(frozen=True, **_SLOTS)
+class DeviceState:
+    """Snapshot of the values a client typically polls, fields the device could not provide are None."""
+
+    status: t.Optional[PlayState] = None
+    name: t.Optional[str] = None
+    text: t.Optional[str] = None
+    artist: t.Optional[str] = None
+    album: t.Optional[str] = None
+    graphic: t.Optional[str] = None
+    duration: t.Optional[int] = None
+    position: t.Optional[int] = None
+    volume: t.Optional[int] = None
+    mute: t.Optional[bool] = None
@@ -1,21 +1,29 @@
 import asyncio
-from contextlib import AbstractAsyncContextManager
-import time
-from typing import Optional, Type, Any
+from typing import Dict, Optional, Type
 from types import TracebackType
 
+# waits shorter than this are below the resolution of the event loop's timers
+MIN_SLEEP_IN_SECONDS = 0.002
+
 
 class Throttler:
     """Ensures that a time between executions is taken into account for each wrapped code block,
     which can be configured for every entry."""
 
+    __slots__ = ("_lock", "_next_execution_not_before", "_context_managers")
+
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
         self._next_execution_not_before: Optional[float] = None
+        # the context managers keep no state of their own, so one per delay is enough
+        self._context_managers: Dict[float, "Throttler._ThrottleContextManager"] = {}
 
-    class _ThrottleContextManager(AbstractAsyncContextManager[Any]):
+    class _ThrottleContextManager:
         """Ensures that a time between executions is taken into account for each wrapped code block."""
 
+        # not derived from AbstractAsyncContextManager, which has no __slots__ before python 3.12
+        __slots__ = ("throttler", "time_after_execution_s")
+
         def __init__(
             self, throttler: "Throttler", time_after_execution_s: float
         ) -> None:
@@ -26,25 +34,36 @@ class Throttler:
             await self.throttler._lock.acquire()
             if self.throttler._next_execution_not_before is not None:
                 additional_wait = (
-                    self.throttler._next_execution_not_before - time.monotonic()
+                    self.throttler._next_execution_not_before
+                    - asyncio.get_running_loop().time()
                 )
 
-                if additional_wait > 0:
+                if additional_wait > MIN_SLEEP_IN_SECONDS:
                     await asyncio.sleep(additional_wait)
 
-            return None
-
         async def __aexit__(
             self,
             exc_type: Optional[Type[BaseException]],
             exc: Optional[BaseException],
             tb: Optional[TracebackType],
         ) -> None:
+            # use the clock of the event loop, which also drives asyncio.sleep
             self.throttler._next_execution_not_before = (
-                time.monotonic() + self.time_after_execution_s
+                asyncio.get_running_loop().time() + self.time_after_execution_s
             )
             self.throttler._lock.release()
-            return None
 
     def throttle(self, throttle_after_call_s: float) -> _ThrottleContextManager:
-        return Throttler._ThrottleContextManager(self, throttle_after_call_s)
+        """Wrap a call so that the next wrapped call starts at least `throttle_after_call_s` after it ended.
+
+        Nothing is slept after the call itself, the wait only happens when the next call arrives
+        too early. A single call after a long pause therefore runs immediately.
+        """
+        context_manager = self._context_managers.get(throttle_after_call_s)
+        if context_manager is None:
+            context_manager = Throttler._ThrottleContextManager(
+                self, throttle_after_call_s
+            )
+            self._context_managers[throttle_after_call_s] = context_manager
+
+        return context_manager
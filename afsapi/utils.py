@@ -3,16 +3,50 @@ import xml.etree.ElementTree as ET
 
 
 def unpack_xml(root: t.Optional[ET.Element], key: str) -> t.Optional[str]:
-    if root:
-        element = root.find(key)
+    # findtext returns "" for an element without text, map it to None as well
+    return None if root is None else root.findtext(key) or None
 
-        if element is not None and hasattr(element, "text"):
-            if element.text is not None:
-                return str(element.text)
+
+def unpack_value(root: t.Optional[ET.Element], tag: str) -> t.Optional[str]:
+    """Same as unpack_xml(root, f"value/{tag}").
+
+    Looking up one child at a time stays in the C implementation of ElementTree,
+    while a path with a slash is evaluated by the much slower ElementPath module.
+    """
+    if root is not None:
+        value = root.find("value")
+        if value is not None:
+            return value.findtext(tag) or None
 
     return None
 
 
+def unpack_number(body: bytes, tag: bytes) -> t.Optional[int]:
+    """Read the integer value of a successful FSAPI response straight from its bytes.
+
+    Scalar responses always have the same tiny shape, so slicing out the value is much
+    cheaper than building a tree. Returns None if the body does not look as expected,
+    in which case the caller should parse it properly.
+    """
+    if b"<status>FS_OK</status>" not in body:
+        return None
+
+    start_tag = b"<" + tag + b">"
+    start = body.find(start_tag)
+    if start < 0:
+        return None
+    start += len(start_tag)
+
+    end = body.find(b"</" + tag + b">", start)
+    if end < 0:
+        return None
+
+    try:
+        return int(body[start:end])
+    except ValueError:
+        return None
+
+
 A = t.TypeVar("A")
 B = t.TypeVar("B")
 
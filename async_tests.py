@@ -1,7 +1,7 @@
 """Test of the asynchronous Frontier Silicon interface."""
 import asyncio
-import traceback
 import logging
+import typing as t
 
 from afsapi import AFSAPI
 
@@ -10,39 +10,53 @@ PIN = 1234
 TIMEOUT = 2  # in seconds
 
 
-async def test_sys() -> None:
+def print_results(labels: t.Sequence[str], results: t.Sequence[t.Any]) -> None:
+    """Print the outcome of each gathered call, be it a value or the error it raised."""
+    for label, result in zip(labels, results):
+        if isinstance(result, BaseException):
+            print(f"{label} failed: {result!r}")
+        else:
+            print(f"{label}: {result}")
+
+
+async def test_sys(afsapi: AFSAPI) -> None:
     """Test sys functions."""
     try:
-        afsapi = await AFSAPI.create(URL, PIN, TIMEOUT)
-
         print(f"Set power succeeded? - {await afsapi.set_power(True)}")
-        print(f"Power on: {await afsapi.get_power()}")
-        print(f"Friendly name: {await afsapi.get_friendly_name()}")
+
+        # the lists are read one by one: get_mode and get_eq_preset use the cached lists,
+        # and reading the presets switches the device into navigation mode
         for mode in await afsapi.get_modes():
             print(f"Available Mode: {mode}")
-        print(f"Current Mode: {await afsapi.get_mode()}")
 
         for equaliser in await afsapi.get_equalisers():
             print(f"Equaliser: {equaliser}")
 
-        print(f"EQ Preset: {await afsapi.get_eq_preset()}")
-
         for preset in await afsapi.get_presets():
             print(f"Preset: {preset}")
 
+        print_results(
+            ("Power on", "Friendly name", "Current Mode", "EQ Preset"),
+            await asyncio.gather(
+                afsapi.get_power(),
+                afsapi.get_friendly_name(),
+                afsapi.get_mode(),
+                afsapi.get_eq_preset(),
+                return_exceptions=True,
+            ),
+        )
+
         print(f"Set power succeeded? - {await afsapi.set_power(False)}")
         print(f"Set sleep succeeded? - {await afsapi.set_sleep(10)}")
         print(f"Sleep: {await afsapi.get_sleep()}")
         print(f"Get power {await afsapi.get_power()}")
     except Exception:
-        logging.error(traceback.format_exc())
+        logging.exception("test_sys failed")
 
 
-async def test_volume() -> None:
+async def test_volume(afsapi: AFSAPI) -> None:
     """Test volume functions."""
     try:
-        afsapi = await AFSAPI.create(URL, PIN, TIMEOUT)
-
         set_power = await afsapi.set_power(True)
         print("Set power succeeded? - %s" % set_power)
 
@@ -67,42 +81,45 @@ async def test_volume() -> None:
         power = await afsapi.get_power()
         print("Power on: %s" % power)
     except Exception:
-        logging.error(traceback.format_exc())
+        logging.exception("test_volume failed")
 
 
-async def test_info() -> None:
+async def test_info(afsapi: AFSAPI) -> None:
     """Test info functions."""
     try:
-        afsapi = await AFSAPI.create(URL, PIN, TIMEOUT)
-
         set_power = await afsapi.set_power(True)
         print("Set power succeeded? - %s" % set_power)
 
         power = await afsapi.get_power()
         print("Power on: %s" % power)
 
-        print(f"Radio ID: {await afsapi.get_radio_id()}")
-        print(f"Version: {await afsapi.get_version()}")
-        print(f"MAC: {await afsapi.get_mac()}")
-        print(f"RSSI: {await afsapi.get_rssi()} dBm")
-
-        name = await afsapi.get_play_name()
-        print("Name: %s" % name)
-
-        text = await afsapi.get_play_text()
-        print("Text: %s" % text)
-
-        artist = await afsapi.get_play_artist()
-        print("Artist: %s" % artist)
-
-        album = await afsapi.get_play_album()
-        print("Album: %s" % album)
-
-        graphic = await afsapi.get_play_graphic()
-        print("Graphic: %s" % graphic)
-
-        duration = await afsapi.get_play_duration()
-        print("Duration: %s" % duration)
+        print_results(
+            (
+                "Radio ID",
+                "Version",
+                "MAC",
+                "RSSI (dBm)",
+                "Name",
+                "Text",
+                "Artist",
+                "Album",
+                "Graphic",
+                "Duration",
+            ),
+            await asyncio.gather(
+                afsapi.get_radio_id(),
+                afsapi.get_version(),
+                afsapi.get_mac(),
+                afsapi.get_rssi(),
+                afsapi.get_play_name(),
+                afsapi.get_play_text(),
+                afsapi.get_play_artist(),
+                afsapi.get_play_album(),
+                afsapi.get_play_graphic(),
+                afsapi.get_play_duration(),
+                return_exceptions=True,
+            ),
+        )
 
         # power = await afsapi.set_power(False)
         # print('Set power succeeded? - %s' % set_power)
@@ -110,14 +127,12 @@ async def test_info() -> None:
         # power = await afsapi.get_power()
         # print('Power on: %s' % power)
     except Exception:
-        logging.error(traceback.format_exc())
+        logging.exception("test_info failed")
 
 
-async def test_play() -> None:
+async def test_play(afsapi: AFSAPI) -> None:
     """Test play functions."""
     try:
-        afsapi = await AFSAPI.create(URL, PIN, TIMEOUT)
-
         status = await afsapi.get_play_status()
         print("Status: %s" % status)
 
@@ -133,12 +148,17 @@ async def test_play() -> None:
         print("Prev succeeded? - %s" % rewind)
 
     except Exception:
-        logging.error(traceback.format_exc())
+        logging.exception("test_play failed")
+
 
+async def main() -> None:
+    """Run all tests against a single connection to the device."""
+    async with await AFSAPI.create(URL, PIN, TIMEOUT) as afsapi:
+        # the tests switch the device on and off, so they must not overlap
+        await test_sys(afsapi)
+        await test_volume(afsapi)
+        await test_play(afsapi)
+        await test_info(afsapi)
 
-loop = asyncio.new_event_loop()
 
-loop.run_until_complete(test_sys())
-loop.run_until_complete(test_volume())
-loop.run_until_complete(test_play())
-loop.run_until_complete(test_info())
+asyncio.run(main())
@@ -0,0 +1,173 @@
+"""Navigation against a fake device that leaves navigation mode, e.g. through its front panel."""
+
+import unittest
+import typing as t
+from unittest import mock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from afsapi import AFSAPI, NodeBlockedException
+
+
+def _response(body: str) -> web.Response:
+    return web.Response(
+        text=f'<?xml version="1.0" encoding="UTF-8"?><fsapiResponse>{body}</fsapiResponse>'
+    )
+
+
+def _list(names: t.Sequence[str]) -> str:
+    items = "".join(
+        f'<item key="{key}"><field name="name"><c8_array>{name}</c8_array></field></item>'
+        for key, name in enumerate(names)
+    )
+    return f"<status>FS_OK</status>{items}<listend/>"
+
+
+class FakeDevice:
+    """Answers the navigation nodes with FS_NODE_BLOCKED unless navigation mode is on."""
+
+    def __init__(self) -> None:
+        self.nav_enabled = False
+        self.folder: t.List[int] = []
+        self.selected: t.List[t.Tuple[t.List[int], int]] = []
+        self.calls: t.List[str] = []
+
+    def leave_nav_mode(self) -> None:
+        self.nav_enabled = False
+        self.folder = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        path = request.match_info["path"]
+        value = request.query.get("value", "")
+        self.calls.append(f"{path}?{value}" if value else path)
+
+        if path == "GET/netRemote.nav.state":
+            return _response(
+                f"<status>FS_OK</status><value><u8>{int(self.nav_enabled)}</u8></value>"
+            )
+        elif path == "SET/netRemote.nav.state":
+            self.nav_enabled = value == "1"
+            self.folder = []
+            return _response("<status>FS_OK</status>")
+        elif not self.nav_enabled:
+            return _response("<status>FS_NODE_BLOCKED</status>")
+        elif path == "SET/netRemote.nav.action.navigate":
+            if value == "0xffffffff":
+                self.folder.pop()
+            else:
+                self.folder.append(int(value))
+            return _response("<status>FS_OK</status>")
+        elif path == "SET/netRemote.nav.action.selectItem":
+            self.selected.append((list(self.folder), int(value)))
+            return _response("<status>FS_OK</status>")
+        elif path == "SET/netRemote.nav.action.selectPreset":
+            return _response("<status>FS_OK</status>")
+        elif path == "GET/netRemote.nav.numitems":
+            return _response(
+                f"<status>FS_OK</status><value><s32>{len(self.folder) + 3}</s32></value>"
+            )
+        elif path.startswith("LIST_GET_NEXT/netRemote.nav.presets/"):
+            return _response(_list(["P0", "P1"]))
+        elif path.startswith("LIST_GET_NEXT/netRemote.nav.list/"):
+            return _response(_list([f"{self.folder}/{i}" for i in range(3)]))
+
+        return _response("<status>FS_NODE_DOES_NOT_EXIST</status>")
+
+
+class NavigationModeLostTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.device = FakeDevice()
+        app = web.Application()
+        app.router.add_get("/fsapi/{path:.*}", self.device.handle)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        # don't wait for the device to settle after navigating
+        patcher = mock.patch("afsapi.api.TIME_AFTER_SLOW_SET_CALLS_IN_SECONDS", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.api = AFSAPI(str(self.server.make_url("/fsapi")), 1234, 5, sid="1")
+
+    async def asyncTearDown(self) -> None:
+        await self.api.close()
+        await self.server.close()
+
+    async def test_select_folder_in_subfolder_is_not_repeated(self) -> None:
+        await self.api.nav_select_folder(3)
+        self.device.leave_nav_mode()
+
+        with self.assertRaises(NodeBlockedException):
+            await self.api.nav_select_folder(5)
+
+        self.assertEqual(self.device.folder, [])
+        self.assertEqual(
+            self.device.calls.count("SET/netRemote.nav.action.navigate?5"), 1
+        )
+
+        # the next call enables navigation mode again, starting from the root folder
+        await self.api.nav_select_folder_via_path([3, 5])
+        self.assertEqual(self.device.folder, [3, 5])
+        self.assertEqual(self.api._current_nav_path, [3, 5])
+
+    async def test_select_parent_folder_is_not_repeated(self) -> None:
+        await self.api.nav_select_folder(3)
+        self.device.leave_nav_mode()
+
+        with self.assertRaises(NodeBlockedException):
+            await self.api.nav_select_parent_folder()
+
+        self.assertEqual(
+            self.device.calls.count("SET/netRemote.nav.action.navigate?0xffffffff"), 1
+        )
+
+    async def test_select_item_in_subfolder_is_not_repeated(self) -> None:
+        await self.api.nav_select_folder(3)
+        self.device.leave_nav_mode()
+
+        with self.assertRaises(NodeBlockedException):
+            await self.api.nav_select_item(7)
+
+        self.assertEqual(self.device.selected, [])
+
+    async def test_select_item_in_root_folder_is_repeated(self) -> None:
+        await self.api.nav_get_numitems()
+        self.device.leave_nav_mode()
+
+        self.assertTrue(await self.api.nav_select_item(7))
+        self.assertEqual(self.device.selected, [([], 7)])
+
+    async def test_reads_in_root_folder_are_repeated(self) -> None:
+        await self.api.nav_get_numitems()
+        self.device.leave_nav_mode()
+        self.assertEqual(await self.api.nav_get_numitems(), 3)
+
+        self.device.leave_nav_mode()
+        self.assertEqual(len([item async for item in await self.api.nav_list()]), 3)
+
+    async def test_reads_in_subfolder_are_not_repeated(self) -> None:
+        await self.api.nav_select_folder(3)
+        self.device.leave_nav_mode()
+
+        with self.assertRaises(NodeBlockedException):
+            await self.api.nav_get_numitems()
+
+        await self.api.nav_select_folder_via_path([3])
+        self.device.leave_nav_mode()
+
+        with self.assertRaises(NodeBlockedException):
+            [item async for item in await self.api.nav_list()]
+
+    async def test_presets_are_repeated_in_any_folder(self) -> None:
+        await self.api.nav_select_folder(3)
+        self.device.leave_nav_mode()
+        self.assertEqual(len(await self.api.get_presets()), 2)
+
+        await self.api.nav_select_folder(3)
+        self.device.leave_nav_mode()
+        self.assertTrue(await self.api.select_preset(1))
+
+
+if __name__ == "__main__":
+    unittest.main()